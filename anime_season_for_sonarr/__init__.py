@@ -0,0 +1,6 @@
+"""Bulk add anime to Sonarr from a given anime season.
+
+Submodules pull in their third-party dependencies (httpx, arrapi, questionary,
+tabulate) at import time, so this package deliberately imports none of them:
+the CLI loads only what the selected subcommand needs.
+"""
@@ -0,0 +1,4 @@
+from anime_season_for_sonarr.cli import main
+
+if __name__ == "__main__":
+    main()
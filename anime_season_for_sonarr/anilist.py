@@ -0,0 +1,253 @@
+import time
+from typing import Protocol
+
+import httpx
+
+from anime_season_for_sonarr.models import Show, ShowStore
+
+ANILIST_API_URL = "https://graphql.anilist.co"
+
+
+class Clock(Protocol):
+    """Anything that can wait; used for rate-limit waits so tests can control time."""
+
+    def sleep(self, seconds: float) -> None: ...
+
+
+class SystemClock:
+    """Clock backed by the wall clock."""
+
+    @staticmethod
+    def sleep(seconds: float) -> None:
+        time.sleep(seconds)
+
+
+class AnilistRequestHandler:
+    def __init__(self, client: httpx.Client, clock: Clock | None = None) -> None:
+        self.client = client
+        self.clock: Clock = clock if clock is not None else SystemClock()
+
+    def send_request(self, query: str, variables: dict | None = None) -> dict:
+        while True:
+            response = self.client.post(
+                ANILIST_API_URL, json={"query": query, "variables": variables}
+            )
+            retry = self._handle_outcome(response)
+
+            # Parse response and check for GraphQL errors
+            response_data = response.json()
+            if response_data.get("errors"):
+                error_messages = [
+                    error.get("message", "Unknown error")
+                    for error in response_data["errors"]
+                ]
+                raise Exception(f"AniList GraphQL errors: {', '.join(error_messages)}")
+
+            if not retry:
+                return response_data
+
+    def _handle_outcome(self, response: httpx.Response) -> bool:
+        if response.status_code == 429:
+            if "Retry-After" in response.headers:
+                retry_after = int(response.headers["Retry-After"])
+                print(f"Rate limited. Waiting {retry_after} seconds...")
+                self.clock.sleep(retry_after)
+            else:
+                # Fallback: wait 60 seconds
+                print("Rate limited. Waiting 60 seconds... (fallback)")
+                self.clock.sleep(60)
+            return True
+
+        # Check for other errors
+        if response.status_code != 200:
+            raise Exception(
+                f"AniList API error: {response.status_code=} - {response.text=}"
+            )
+
+        return False
+
+
+def get_genre_and_tag_list(anilist: AnilistRequestHandler) -> tuple[list, list]:
+    """
+    Returns the list of genres and tags.
+
+    Adult tags are excluded.
+    """
+
+    query = """
+    query {
+        genres: GenreCollection
+        tags: MediaTagCollection {
+            name
+            description
+            category
+            isAdult
+        }
+    }
+    """
+
+    response_data = anilist.send_request(query)
+
+    genres: list = response_data["data"]["genres"]
+
+    tags: list = list(
+        filter(lambda tag: tag["isAdult"] is False, response_data["data"]["tags"])
+    )
+    for tag in tags:
+        del tag["isAdult"]
+
+    return genres, tags
+
+
+def get_season_list(  # noqa: PLR0913
+    anilist: AnilistRequestHandler,
+    year: int,
+    season: str,
+    genres_include: list[str] | None = None,
+    genres_exclude: list[str] | None = None,
+    tags_include: list[str] | None = None,
+    tags_exclude: list[str] | None = None,
+) -> ShowStore:
+    """Get the list of anime from Anilist API for the given season."""
+
+    page = 1
+    has_next_page = None
+    shows = ShowStore()
+
+    while (page == 1) or has_next_page:
+        variables = {
+            "page": page,
+            "season": season.upper(),
+            "seasonYear": year,
+        }
+
+        # Ugly string manipulation because of how graphql variables work
+        query1 = """
+        query (
+        $page: Int,
+        $season: MediaSeason,
+        $seasonYear: Int,
+        """
+
+        query2 = """
+        ) {
+            Page (page: $page, perPage: 30) {
+                pageInfo {
+                    hasNextPage
+                    currentPage
+                    lastPage
+                }
+                media (
+                    season: $season,
+                    seasonYear: $seasonYear,
+                    type: ANIME,
+                    format: TV,
+        """
+
+        if genres_include:
+            query1 += "$genres_include: [String],"
+            query2 += "genre_in: $genres_include,"
+            variables.update({"genres_include": genres_include})
+        if genres_exclude:
+            query1 += "$genres_exclude: [String],"
+            query2 += "genre_not_in: $genres_exclude,"
+            variables.update({"genres_exclude": genres_exclude})
+        if tags_include:
+            query1 += "$tags_include: [String],"
+            query2 += "tag_in: $tags_include,"
+            variables.update({"tags_include": tags_include})
+        if tags_exclude:
+            query1 += "$tags_exclude: [String],"
+            query2 += "tag_not_in: $tags_exclude,"
+            variables.update({"tags_exclude": tags_exclude})
+
+        query2 += """
+                ) {
+                    id
+                    title {
+                        romaji
+                        english
+                    }
+                    seasonYear
+                }
+            }
+        }
+        """
+
+        query = query1 + query2
+
+        response_data = anilist.send_request(query, variables)
+
+        has_next_page = response_data["data"]["Page"]["pageInfo"]["hasNextPage"]
+        page += 1
+
+        shows.extend(
+            Show(
+                english_title=entry["title"]["english"],
+                romaji_title=entry["title"]["romaji"],
+                anilist_id=entry["id"],
+                air_year=entry["seasonYear"],
+            )
+            for entry in response_data["data"]["Page"]["media"]
+        )
+
+    if not shows:  # if no shows are found (the store is empty)
+        raise Exception(
+            f"[ERROR] No anime in {year=}, {season=} with the configured genres/tags."
+        )
+
+    return shows
+
+
+def search_previous_season(anilist: AnilistRequestHandler, show: Show) -> Show:
+    """Search for the previous season of a show via Anilist API. Return the previous season."""
+
+    query = """
+    query ($id: Int) {
+        Media(id: $id, type: ANIME) {
+            relations {
+                edges {
+                    relationType
+                    node {
+                        id
+                        title {
+                            romaji
+                            english
+                        }
+                        seasonYear
+                    }
+                }
+            }
+        }
+    }
+    """
+
+    variables = {"id": show.anilist_id}
+
+    response_data = anilist.send_request(query, variables)
+
+    parent_story = None
+    prequel = None
+
+    for entry in response_data["data"]["Media"]["relations"]["edges"]:
+        if entry["relationType"] == "PARENT":
+            parent_story = Show(
+                english_title=entry["node"]["title"]["english"],
+                romaji_title=entry["node"]["title"]["romaji"],
+                anilist_id=entry["node"]["id"],
+                air_year=entry["node"]["seasonYear"],
+            )
+        if entry["relationType"] == "PREQUEL":
+            prequel = Show(
+                english_title=entry["node"]["title"]["english"],
+                romaji_title=entry["node"]["title"]["romaji"],
+                anilist_id=entry["node"]["id"],
+                air_year=entry["node"]["seasonYear"],
+            )
+
+    if (parent_story is None) and (prequel is None):
+        raise Exception(f"[ERROR] No valid relations found for <{show}>.")
+
+    show_to_search: Show = parent_story if parent_story else prequel
+
+    return show_to_search
@@ -0,0 +1,220 @@
+"""Command line entry point.
+
+Only the standard library is imported at module level. Each subcommand imports
+the submodules (and with them httpx, arrapi, questionary, tabulate) it needs, so
+cheap invocations such as ``--help`` or ``--tag-list simple`` don't pay for the
+Sonarr and UI dependencies. ``benchmarks/bench_startup.py`` keeps this honest.
+"""
+
+import argparse
+import datetime
+import os
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import httpx
+
+    from anime_season_for_sonarr.config import Config
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser."""
+
+    parser = argparse.ArgumentParser(
+        prog="anime-season-for-sonarr",
+        description="Script to bulk add seasonal anime to Sonarr.",
+        epilog="Configure the script with config.toml.",
+    )
+
+    parser.add_argument("year", nargs="?", type=int, help="year of the anime season.")
+    parser.add_argument(
+        "season",
+        nargs="?",
+        choices=["winter", "spring", "summer", "fall"],
+        help="season of the anime season. Lowercase.",
+    )
+    parser.add_argument(
+        "--tag-list",
+        nargs="?",
+        choices=["simple", "fancy"],
+        const="fancy",
+        help="Print genres and tags.",
+    )
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Parse the arguments and run the selected subcommand."""
+
+    options = build_parser().parse_args(argv)
+
+    if options.tag_list:
+        print_tag_list(options.tag_list)
+        sys.exit(0)
+
+    elif (not options.year) or (not options.season):
+        print("Error: use --help to see usage.")
+        sys.exit(1)
+
+    import httpx  # noqa: PLC0415
+
+    from anime_season_for_sonarr.config import Config  # noqa: PLC0415
+
+    config = Config.load("config.toml")
+
+    with httpx.Client() as client:
+        add_season(options.year, options.season, config, client)
+
+
+def clear_screen() -> None:
+    """Clear the screen."""
+    os.system("cls" if os.name == "nt" else "clear")  # noqa: S605
+
+
+def print_tag_list(tag_list_format: str) -> None:
+    """Print the AniList genres and tags, as a table ("fancy") or plain lists ("simple")."""
+
+    import httpx  # noqa: PLC0415
+
+    from anime_season_for_sonarr.anilist import (  # noqa: PLC0415
+        AnilistRequestHandler,
+        get_genre_and_tag_list,
+    )
+
+    with httpx.Client() as client:
+        genres, tags = get_genre_and_tag_list(AnilistRequestHandler(client))
+
+    if tag_list_format == "fancy":
+        from tabulate import tabulate  # noqa: PLC0415
+
+        print(
+            tabulate(([x] for x in genres), headers=["Genres"], tablefmt="mixed_grid")
+        )
+
+        print(
+            "\nTag list\n"
+            + tabulate(
+                tags,
+                headers="keys",
+                maxcolwidths=[None, 50, None, None],
+                tablefmt="mixed_grid",
+            )
+        )
+
+    elif tag_list_format == "simple":
+        print("== Genres ==\n" + "\n".join(genres))
+        print("\n== Tags ==\n" + "\n".join([tag["name"] for tag in tags]))
+
+
+def add_season(
+    year: int, season: str, config: "Config", client: "httpx.Client"
+) -> None:
+    """Search the given season and add the selected anime to Sonarr."""
+
+    import arrapi  # noqa: PLC0415
+
+    from anime_season_for_sonarr.anilist import (  # noqa: PLC0415
+        AnilistRequestHandler,
+        get_season_list,
+    )
+    from anime_season_for_sonarr.models import ShowStore, Status  # noqa: PLC0415
+    from anime_season_for_sonarr.sonarr import (  # noqa: PLC0415
+        add_series_to_sonarr,
+        get_shows_in_sonarr,
+    )
+    from anime_season_for_sonarr.tmdb import (  # noqa: PLC0415
+        TMDBRequestHandler,
+        get_TMDB_genre_id,
+        get_TVDB_id_from_TMDB_id,
+        search_TMDB_for_show,
+    )
+
+    anilist = AnilistRequestHandler(client)
+    tmdb = TMDBRequestHandler(client, config.tmdb_api_key)
+
+    clear_screen()
+    print(
+        f"===== Anime Season For Sonarr =====\nYear: {year}\nSeason: {season.capitalize()}\n\nSearching...\n"
+    )
+
+    genre_id: int = get_TMDB_genre_id(tmdb, "Animation")
+
+    shows: ShowStore = get_season_list(
+        anilist,
+        year,
+        season,
+        config.genres_include,
+        config.genres_exclude,
+        config.tags_include,
+        config.tags_exclude,
+    )
+
+    # try to add the tmdb_id and the tvdb_id to each show, marking it FOUND or ERROR
+    for row, show in enumerate(shows):
+        try:
+            tmdb_id: int = search_TMDB_for_show(
+                tmdb, anilist, show, genre_id, config.target_countries
+            )
+            shows.update(row, tmdb_id=tmdb_id)
+            tvdb_id: int = get_TVDB_id_from_TMDB_id(tmdb, tmdb_id)
+            shows.update(row, tvdb_id=tvdb_id, status=Status.FOUND)
+        except SystemExit as e:
+            print(e)
+            sys.exit(1)
+        except Exception as e:
+            print(e)
+            shows.update(row, status=Status.ERROR)
+
+    # log error titles to file if there are any
+    if shows.count(Status.ERROR) and config.log:
+        with open("log_search_errors.txt", "a", encoding="utf-8") as file:
+            file.write(
+                f"{datetime.datetime.now()} - Year: {year} - Season: {season.capitalize()}\n"
+            )
+            for show in shows.shows(Status.ERROR):
+                file.write(f"{show}\n")
+            file.write("-----\n")
+
+    if not shows.count(Status.FOUND):
+        print(
+            "The search concluded with no anime that has a TVDB ID, so nothing can get added to Sonarr."
+        )
+        sys.exit(1)
+
+    try:
+        sonarr: arrapi.SonarrAPI = arrapi.SonarrAPI(
+            config.sonarr_base_url, config.sonarr_api_key
+        )
+    except Exception as e:
+        print(
+            f"-----\n{e}\nCan't connect to Sonarr. Possible fix: check the URL and API key."
+        )
+        sys.exit(1)
+
+    shows_exist_sonarr: list[int] = get_shows_in_sonarr(sonarr)
+
+    # if select_all is not enabled, ask the user which series they want to add
+    if not config.select_all:
+        from anime_season_for_sonarr.ui import interactive_selection  # noqa: PLC0415
+
+        selected_shows: list[int] = interactive_selection(
+            shows.shows(Status.FOUND), shows_exist_sonarr, config.romaji
+        )
+    else:  # if select all is enabled, add all shows
+        print("Select all enabled. Adding all shows...")
+        selected_shows: list[int] = shows.tvdb_ids(Status.FOUND)
+
+    try:
+        # Add series to Sonarr
+        added, exists, not_found, excluded = add_series_to_sonarr(
+            selected_shows, sonarr, config
+        )
+    except Exception as e:
+        print(e)
+        sys.exit(1)
+
+    print(
+        f"Added: {added}\nExists: {exists}\nNot Found: {not_found}\nExcluded: {excluded}"
+    )
@@ -0,0 +1,76 @@
+import tomllib
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Config:
+    """Settings read from config.toml."""
+
+    # [SCRIPT]
+    select_all: bool
+    romaji: bool
+    log: bool
+    target_countries: frozenset[str]
+
+    # [ANILIST]
+    genres_include: list[str]
+    genres_exclude: list[str]
+    tags_include: list[str]
+    tags_exclude: list[str]
+
+    # [TMDB]
+    tmdb_api_key: str
+
+    # [SONARR]
+    sonarr_base_url: str
+    sonarr_api_key: str
+    root_folder: str
+    quality_profile: str
+    language_profile: str | None
+    monitor: str
+    season_folder: bool
+    search: bool
+    unmet_search: bool
+    series_type: str
+    tags: list[str] | None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Config":
+        """Build the config from the parsed toml document."""
+
+        script = data["SCRIPT"]
+        anilist = data["ANILIST"]
+        sonarr = data["SONARR"]
+
+        return cls(
+            select_all=script["select-all"],
+            romaji=script["romaji"],
+            log=script["log"],
+            target_countries=frozenset(script["target-countries"]),
+            genres_include=anilist["includes-genres"],
+            genres_exclude=anilist["excludes-genres"],
+            tags_include=anilist["includes-tags"],
+            tags_exclude=anilist["excludes-tags"],
+            tmdb_api_key=data["TMDB"]["tmdb-api-key"],
+            sonarr_base_url=sonarr["base-url"],
+            sonarr_api_key=sonarr["sonarr-api-key"],
+            root_folder=sonarr["root-folder"],
+            quality_profile=sonarr["quality-profile"],
+            # "NULL" is the sonarr v4 placeholder for "no language profile"
+            language_profile=None
+            if sonarr["language-profile"] == "NULL"
+            else sonarr["language-profile"],
+            monitor=sonarr["monitor"],
+            season_folder=sonarr["season-folder"],
+            search=sonarr["search"],
+            unmet_search=sonarr["unmet-search"],
+            series_type=sonarr["series-type"].lower(),
+            tags=sonarr["tags"] or None,
+        )
+
+    @classmethod
+    def load(cls, path: str = "config.toml") -> "Config":
+        """Read and parse a config.toml file."""
+
+        with open(path, "rb") as file:
+            return cls.from_dict(tomllib.load(file))
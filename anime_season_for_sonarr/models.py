@@ -0,0 +1,171 @@
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from enum import IntEnum
+
+
+@dataclass(slots=True)
+class Show:
+    """Show dataclass."""
+
+    english_title: str
+    romaji_title: str
+    anilist_id: int
+    air_year: int
+    tmdb_id: int | None = None
+    tvdb_id: int | None = None
+
+
+class Status(IntEnum):
+    """Resolution status of a show in a `ShowStore`."""
+
+    PENDING = 0
+    FOUND = 1  # has a TVDB ID
+    ERROR = 2
+
+
+# IDs and years are never 0, so 0 marks a missing value in the int columns
+_MISSING = 0
+
+
+class ShowStore:
+    """
+    Columnar, array-backed collection of shows.
+
+    Every show is a row spread over parallel arrays (IDs, air year, status
+    byte) plus two title lists, which keeps large catalogs much smaller than a
+    list of `Show` objects. Indexing and iterating build a `Show` on the fly;
+    it is a copy, so write changes back with `update`.
+    """
+
+    def __init__(self, shows: Iterable[Show] = ()) -> None:
+        self._anilist_ids = array("i")
+        self._tmdb_ids = array("i")
+        self._tvdb_ids = array("i")
+        self._air_years = array("H")
+        self._english_titles: list[str | None] = []
+        self._romaji_titles: list[str | None] = []
+        self._status = bytearray()
+
+        self._rows: dict[int, int] = {}  # anilist_id -> row of its first occurrence
+
+        self.extend(shows)
+
+    def __len__(self) -> int:
+        return len(self._anilist_ids)
+
+    def __getitem__(self, row: int) -> Show:
+        if row < 0:
+            row += len(self)
+            if row < 0:
+                raise IndexError("ShowStore index out of range")
+
+        return Show(
+            english_title=self._english_titles[row],
+            romaji_title=self._romaji_titles[row],
+            anilist_id=self._anilist_ids[row],
+            air_year=self._air_years[row] or None,
+            tmdb_id=self._tmdb_ids[row] or None,
+            tvdb_id=self._tvdb_ids[row] or None,
+        )
+
+    def __iter__(self) -> Iterator[Show]:
+        for row in range(len(self)):
+            yield self[row]
+
+    def append(self, show: Show, status: Status = Status.PENDING) -> int:
+        """Add a show and return its row."""
+
+        row = len(self)
+
+        # a title parsed from JSON is a fresh string even when english == romaji,
+        # so keep a single copy in that case
+        romaji_title = show.romaji_title
+        english_title = (
+            romaji_title if show.english_title == romaji_title else show.english_title
+        )
+
+        try:
+            self._anilist_ids.append(show.anilist_id)
+            self._tmdb_ids.append(show.tmdb_id or _MISSING)
+            self._tvdb_ids.append(show.tvdb_id or _MISSING)
+            self._air_years.append(show.air_year or _MISSING)
+            self._english_titles.append(english_title)
+            self._romaji_titles.append(romaji_title)
+            self._status.append(status)
+        except (OverflowError, TypeError, ValueError):
+            # a value didn't fit its column: drop what was already appended so
+            # the columns stay the same length
+            for column in self._columns():
+                del column[row:]
+            raise
+
+        self._rows.setdefault(show.anilist_id, row)
+
+        return row
+
+    def extend(self, shows: Iterable[Show]) -> None:
+        """Add several shows."""
+
+        for show in shows:
+            self.append(show)
+
+    def row(self, anilist_id: int) -> int:
+        """Return the row of the show with the given AniList ID. Raise KeyError if missing."""
+
+        return self._rows[anilist_id]
+
+    def update(
+        self,
+        row: int,
+        *,
+        tmdb_id: int | None = None,
+        tvdb_id: int | None = None,
+        status: Status | None = None,
+    ) -> None:
+        """Set the given fields of a row, leaving the others untouched."""
+
+        if tmdb_id is not None:
+            self._tmdb_ids[row] = tmdb_id
+        if tvdb_id is not None:
+            self._tvdb_ids[row] = tvdb_id
+        if status is not None:
+            self._status[row] = status
+
+    def status(self, row: int) -> Status:
+        """Return the status of a row."""
+
+        return Status(self._status[row])
+
+    def count(self, status: Status) -> int:
+        """Return the number of rows with the given status."""
+
+        return self._status.count(status)
+
+    def shows(self, status: Status) -> list[Show]:
+        """Return the shows with the given status."""
+
+        return [self[row] for row in self._rows_with(status)]
+
+    def tvdb_ids(self, status: Status = Status.FOUND) -> list[int]:
+        """Return the TVDB IDs of the shows with the given status."""
+
+        return [self._tvdb_ids[row] for row in self._rows_with(status)]
+
+    def _columns(self) -> tuple:
+        return (
+            self._anilist_ids,
+            self._tmdb_ids,
+            self._tvdb_ids,
+            self._air_years,
+            self._english_titles,
+            self._romaji_titles,
+            self._status,
+        )
+
+    def _rows_with(self, status: Status) -> Iterator[int]:
+        # bytearray.find is a C-level scan, much faster than testing every row
+        row = self._status.find(status)
+        while row != -1:
+            yield row
+            row = self._status.find(status, row + 1)
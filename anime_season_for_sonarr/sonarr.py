@@ -0,0 +1,31 @@
+import arrapi
+
+from anime_season_for_sonarr.config import Config
+
+
+def get_shows_in_sonarr(sonarr: arrapi.SonarrAPI) -> list[int]:
+    """Return the TVDB IDs of the shows in Sonarr."""
+
+    series = sonarr.all_series()
+    return [int(entry.tvdbId) for entry in series]
+
+
+def add_series_to_sonarr(  # noqa: ANN201
+    tvdb_ids: list[int], sonarr: arrapi.SonarrAPI, config: Config
+):
+    """Add given TVDB IDs to Sonarr."""
+
+    added, exists, not_found, excluded = sonarr.add_multiple_series(
+        ids=tvdb_ids,
+        root_folder=config.root_folder,
+        quality_profile=config.quality_profile,
+        language_profile=config.language_profile,
+        monitor=config.monitor,
+        season_folder=config.season_folder,
+        search=config.search,
+        unmet_search=config.unmet_search,
+        series_type=config.series_type,
+        tags=config.tags,
+    )
+
+    return added, exists, not_found, excluded
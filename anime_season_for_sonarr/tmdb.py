@@ -0,0 +1,134 @@
+import sys
+
+import httpx
+
+from anime_season_for_sonarr.anilist import (
+    AnilistRequestHandler,
+    search_previous_season,
+)
+from anime_season_for_sonarr.models import Show
+
+TMDB_API_URL = "https://api.themoviedb.org/3"
+
+
+class TMDBRequestHandler:
+    def __init__(self, client: httpx.Client, api_key: str) -> None:
+        self.client = client
+        self.api_key = api_key
+
+    def get(self, endpoint: str, params: dict | None = None) -> dict:
+        """GET an endpoint (relative to the API root) and return the parsed JSON."""
+
+        response = self.client.get(
+            f"{TMDB_API_URL}/{endpoint}",
+            params={"api_key": self.api_key, **(params or {})},
+        )
+        return response.json()
+
+
+def build_TMDB_genre_dict(tmdb: TMDBRequestHandler) -> dict[str, int]:
+    """Build a list of TMDB genres."""
+
+    response = tmdb.get("genre/movie/list")
+    genre_dict = {}
+    for genre in response["genres"]:
+        genre_dict.update({genre["name"]: genre["id"]})
+    return genre_dict
+
+
+def get_TMDB_genre_id(tmdb: TMDBRequestHandler, genre_to_find: str) -> int:
+    """Get the TMDB genre ID for anime."""
+
+    genre_dict = build_TMDB_genre_dict(tmdb)
+    for genre_name, genre_id in genre_dict.items():
+        if genre_name == genre_to_find:
+            return genre_id
+    raise Exception(f"[ERROR] Genre '{genre_to_find}' not found.")
+
+
+def search_TMDB_for_show(
+    tmdb: TMDBRequestHandler,
+    anilist: AnilistRequestHandler,
+    show: Show,
+    target_genre_id: int,
+    target_countries: frozenset[str],
+) -> int:
+    """Search for a show on TMDB, if it's found return the TMDB ID."""
+
+    titles = (show.english_title, show.romaji_title)
+    include_air_year = (True, False)
+
+    # search in this order:
+    # 1 - english + air year
+    # 2 - romaji + air year
+    # 3 - english
+    # 4 - romaji
+
+    # ends search when the first result is found
+
+    response = None
+
+    for option in include_air_year:
+        for title in titles:
+            if title is None:
+                # mock a response with 0 results
+                response = {"total_results": 0}
+                continue
+
+            params = {"query": title, "page": 1}
+            if option:
+                params["first_air_date_year"] = show.air_year
+            try:
+                response = tmdb.get("search/tv", params)
+            except Exception as e:
+                print(e)
+                sys.exit(1)
+
+            if response["total_results"] != 0:
+                break
+        else:  # else block is executed only if the loop ends without breaks
+            response = None
+            continue
+        break  # so if we break in the inner loop we also break out of the outer
+
+    # if there are no results, search recursively for parent story / prequel
+    if not response:
+        next_show = search_previous_season(anilist, show)
+        return search_TMDB_for_show(
+            tmdb, anilist, next_show, target_genre_id, target_countries
+        )
+
+    # Iterate through all the results and return the first one with the correct genre and country
+    current_page = response["page"]
+    last_page = response["total_pages"]
+
+    while current_page <= last_page:
+        for result in response["results"]:
+            if (target_genre_id in result["genre_ids"]) and (result["origin_country"][0] in target_countries):  # fmt: skip
+                return int(result["id"])
+
+        current_page += 1
+        params = {
+            "first_air_date_year": show.air_year,
+            "query": title,
+            "page": current_page,
+        }
+        response = tmdb.get("search/tv", params)
+
+    raise Exception(
+        f"[ERROR] No result with <genre id: {target_genre_id}> and <target countries: {set(target_countries)}> found for <{show}> on TMDB."
+    )
+
+
+def get_TVDB_id_from_TMDB_id(tmdb: TMDBRequestHandler, tmdb_id: int) -> int:
+    """Get the TVDB ID from a TMDB ID."""
+
+    response = tmdb.get(f"tv/{tmdb_id}/external_ids")
+
+    if "tvdb_id" not in response:
+        raise Exception(f"[ERROR] No TVDB ID field for <TMDB ID: {tmdb_id}>.")
+
+    if response["tvdb_id"] is None:
+        raise Exception(f"[ERROR] TVDB ID is None for <TMDB ID: {tmdb_id}>.")
+
+    return int(response["tvdb_id"])
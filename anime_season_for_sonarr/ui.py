@@ -0,0 +1,34 @@
+from collections.abc import Iterable
+
+import questionary
+
+from anime_season_for_sonarr.models import Show
+
+
+def interactive_selection(
+    all_shows: Iterable[Show], existing_tvdb_ids: Iterable[int], romaji: bool
+) -> list[int]:
+    """Interactive selection screen. Return a list of TVDB IDs of the selected shows."""
+
+    existing_tvdb_ids = set(existing_tvdb_ids)  # O(1) lookups for large libraries
+
+    # fmt: off
+    choices = [
+        questionary.Choice(
+            # prefer the title specified in the config; fallback to the romaji if the english one is None
+            title=show.romaji_title if (romaji and show.romaji_title) else show.english_title if show.english_title else show.romaji_title,
+            value=show.tvdb_id,
+            disabled="Anime already exists in Sonarr" if show.tvdb_id in existing_tvdb_ids else None,
+        )
+        for show in all_shows
+    ]
+    # fmt: on
+
+    selected_shows: list[int] | None = questionary.checkbox(
+        "Select anime to add to Sonarr:", choices=choices
+    ).ask()
+
+    if selected_shows is None:
+        raise TypeError("[ERROR] No shows selected.")
+
+    return selected_shows
@@ -0,0 +1,129 @@
+"""Startup benchmark: import time per subcommand, checked against a budget.
+
+Run from the repository root:
+
+    python benchmarks/bench_startup.py
+
+Each scenario imports the modules a subcommand needs in a fresh interpreter
+with ``-X importtime`` and sums the cumulative time of the package's top-level
+imports (interpreter startup is excluded). The best of a few runs is compared
+to the budget, and the scenario also fails if it loads a dependency it must
+not need. Exits with status 1 if any scenario is over budget.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from tabulate import tabulate
+
+ROOT = Path(__file__).parent.parent
+PACKAGE = "anime_season_for_sonarr"
+RUNS = 5
+
+# (name, modules imported, budget in ms, modules that must stay unloaded)
+SCENARIOS = [
+    (
+        "--help",
+        [f"{PACKAGE}.cli"],
+        20,
+        ["httpx", "arrapi", "questionary", "tabulate"],
+    ),
+    (
+        "--tag-list simple",
+        [f"{PACKAGE}.cli", f"{PACKAGE}.anilist"],
+        150,
+        ["arrapi", "questionary", "tabulate"],
+    ),
+    (
+        "<year> <season>",
+        [
+            f"{PACKAGE}.cli",
+            f"{PACKAGE}.config",
+            f"{PACKAGE}.anilist",
+            f"{PACKAGE}.tmdb",
+            f"{PACKAGE}.sonarr",
+            f"{PACKAGE}.ui",
+        ],
+        500,
+        ["tabulate"],
+    ),
+]
+
+
+def measure_import_ms(modules: list[str]) -> float:
+    """Return the import time of the given modules in a fresh interpreter, in ms."""
+
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    total_us = 0
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        # anything else on stderr (e.g. a DeprecationWarning) is skipped
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|", 2)
+        # nested imports are indented, so only top-level package imports match
+        if name.startswith(f" {PACKAGE}"):
+            total_us += int(cumulative)
+
+    return total_us / 1000
+
+
+def loaded_modules(modules: list[str], candidates: list[str]) -> list[str]:
+    """Return which of the candidates end up in sys.modules after the imports."""
+
+    code = (
+        f"import sys, {', '.join(modules)}\n"
+        f"print(' '.join(m for m in {candidates!r} if m in sys.modules))"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.split()
+
+
+def main() -> None:
+    rows = []
+    failed = False
+
+    for name, modules, budget_ms, forbidden in SCENARIOS:
+        best_ms = min(measure_import_ms(modules) for _ in range(RUNS))
+        leaked = loaded_modules(modules, forbidden)
+        ok = best_ms <= budget_ms and not leaked
+        failed |= not ok
+
+        rows.append(
+            [
+                name,
+                f"{best_ms:.1f}",
+                budget_ms,
+                ", ".join(leaked) or "-",
+                "ok" if ok else "FAIL",
+            ]
+        )
+
+    print(
+        tabulate(
+            rows,
+            headers=["Subcommand", "Import [ms]", "Budget [ms]", "Unwanted", "Result"],
+            tablefmt="mixed_grid",
+        )
+    )
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Memory/speed benchmark: ShowStore against plain lists of Show objects.
+
+Run from the repository root:
+
+    python benchmarks/bench_store.py [number of shows]
+
+Builds a synthetic catalog the size of a full AniList TV resolution run,
+resolves every show (sets TMDB/TVDB IDs and a status) the way the CLI does,
+and reports the tracemalloc peak and wall time of each representation, plus
+AniList ID -> row lookups. The baselines are the previous layout (a list of
+regular, non-slotted Show dataclasses) and a list of the current slotted Show.
+"""
+
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+
+from tabulate import tabulate
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from anime_season_for_sonarr.models import Show, ShowStore, Status
+
+DEFAULT_SHOWS = 50_000
+
+
+@dataclass
+class LegacyShow:
+    """The Show dataclass as it was before __slots__, with a per-instance __dict__."""
+
+    english_title: str
+    romaji_title: str
+    anilist_id: int
+    air_year: int
+    tmdb_id: int | None = None
+    tvdb_id: int | None = None
+
+
+def make_shows(count: int) -> list[tuple]:
+    """Raw AniList-like entries. Roughly a third have no english title."""
+
+    return [
+        (
+            None if i % 3 == 0 else f"English Title {i}",
+            f"Romaji Title {i}",
+            100_000 + i,
+            1990 + i % 35,
+        )
+        for i in range(count)
+    ]
+
+
+def run_list(show_class: type, entries: list[tuple]) -> Callable[[int], Show]:
+    shows = [
+        show_class(english_title=e, romaji_title=r, anilist_id=a, air_year=y)
+        for e, r, a, y in entries
+    ]
+    shows_success: list = []
+    shows_error: list = []
+    for i, show in enumerate(shows):
+        if i % 10 == 0:
+            shows_error.append(show)
+            continue
+        show.tmdb_id = 200_000 + i
+        show.tvdb_id = 300_000 + i
+        shows_success.append(show)
+    tvdb_ids = [show.tvdb_id for show in shows_success]  # noqa: F841
+
+    rows = {show.anilist_id: show for show in shows}
+    return lambda anilist_id: rows[anilist_id]
+
+
+def run_store(entries: list[tuple]) -> Callable[[int], Show]:
+    shows = ShowStore(
+        Show(english_title=e, romaji_title=r, anilist_id=a, air_year=y)
+        for e, r, a, y in entries
+    )
+    for row in range(len(shows)):
+        if row % 10 == 0:
+            shows.update(row, status=Status.ERROR)
+            continue
+        shows.update(
+            row, tmdb_id=200_000 + row, tvdb_id=300_000 + row, status=Status.FOUND
+        )
+    tvdb_ids = shows.tvdb_ids(Status.FOUND)  # noqa: F841
+
+    return lambda anilist_id: shows[shows.row(anilist_id)]
+
+
+def measure(run: Callable, entries: list[tuple]) -> tuple[float, float, float]:
+    """Return (peak MiB, build+resolve seconds, lookup microseconds per ID)."""
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    lookup = run(entries)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    ids = [entry[2] for entry in entries]
+    start = time.perf_counter()
+    for anilist_id in ids:
+        lookup(anilist_id)
+    lookup_us = (time.perf_counter() - start) / len(ids) * 1e6
+
+    return peak / 2**20, elapsed, lookup_us
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SHOWS
+    entries = make_shows(count)
+
+    rows = []
+    runs = (
+        ("list[Show] (no slots)", partial(run_list, LegacyShow)),
+        ("list[Show] (slots)", partial(run_list, Show)),
+        ("ShowStore", run_store),
+    )
+    for name, run in runs:
+        peak_mib, elapsed, lookup_us = measure(run, entries)
+        rows.append([name, f"{peak_mib:.1f}", f"{elapsed:.3f}", f"{lookup_us:.2f}"])
+
+    print(f"{count} shows")
+    print(
+        tabulate(
+            rows,
+            headers=["Storage", "Peak [MiB]", "Resolve [s]", "Lookup [us]"],
+            tablefmt="mixed_grid",
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""Record/replay HTTP transport for the test suite.
+
+In replay mode (the default) requests are answered from a JSON cassette and
+never touch the network. Set ``CASSETTE_RECORD=1`` to forward requests to the
+real APIs; the cassette is (re)written when the client is closed, but only if
+the recording was marked complete (see `record_on_success`).
+"""
+
+import functools
+import json
+import os
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httpx
+
+CASSETTE_DIR = Path(__file__).parent / "cassettes"
+RECORD = os.environ.get("CASSETTE_RECORD") == "1"
+
+# query parameters that must never be written to disk
+REDACTED_PARAMS = {"api_key"}
+
+
+class CassetteMissError(Exception):
+    """Raised when a replayed request has no recorded response."""
+
+
+def _normalize_url(url: httpx.URL) -> str:
+    """Drop secrets from the URL so recordings are shareable and key-independent."""
+
+    parts = urlsplit(str(url))
+    query = [(k, v) for k, v in parse_qsl(parts.query) if k not in REDACTED_PARAMS]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+class CassetteTransport(httpx.BaseTransport):
+    """Transport that records real responses once and replays them afterwards."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        record: bool = RECORD,
+        inner: httpx.BaseTransport | None = None,
+    ) -> None:
+        """
+        `inner` is the transport that answers requests while recording; it
+        defaults to the real network.
+        """
+
+        self.path = path
+        self.record = record
+        self.interactions: list[dict] = []
+        self._inner: httpx.BaseTransport | None = None
+        self._complete = False
+
+        if record:
+            self._inner = inner if inner is not None else httpx.HTTPTransport()
+        else:
+            if not path.exists():
+                raise CassetteMissError(
+                    f"Cassette <{path.name}> not found. Record it with CASSETTE_RECORD=1."
+                )
+            with open(path, encoding="utf-8") as file:
+                self.interactions = json.load(file)
+            self._unused = list(self.interactions)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        body = request.read().decode("utf-8")
+        key = (request.method, _normalize_url(request.url), body)
+
+        if self.record:
+            return self._record(request, key)
+        return self._replay(request, key)
+
+    def _record(
+        self, request: httpx.Request, key: tuple[str, str, str]
+    ) -> httpx.Response:
+        response = self._inner.handle_request(request)
+        response.read()
+
+        method, url, body = key
+        self.interactions.append(
+            {
+                "request": {"method": method, "url": url, "body": body},
+                "response": {
+                    "status_code": response.status_code,
+                    "headers": {
+                        k: v
+                        for k, v in response.headers.items()
+                        if k.lower() not in {"content-encoding", "content-length"}
+                    },
+                    "content": response.text,
+                },
+            }
+        )
+        return response
+
+    def _replay(
+        self, request: httpx.Request, key: tuple[str, str, str]
+    ) -> httpx.Response:
+        # identical requests are answered in the order they were recorded
+        for index, interaction in enumerate(self._unused):
+            recorded = interaction["request"]
+            if (recorded["method"], recorded["url"], recorded["body"]) == key:
+                del self._unused[index]
+                recorded_response = interaction["response"]
+                return httpx.Response(
+                    status_code=recorded_response["status_code"],
+                    headers=recorded_response["headers"],
+                    content=recorded_response["content"].encode("utf-8"),
+                    request=request,
+                )
+
+        raise CassetteMissError(
+            f"No recorded response for <{key[0]} {key[1]}> in <{self.path.name}>. "
+            "Re-record with CASSETTE_RECORD=1."
+        )
+
+    def complete(self) -> None:
+        """Mark the recording as finished cleanly, so `close` may save it."""
+
+        self._complete = True
+
+    def close(self) -> None:
+        if self._inner is None:
+            return
+        self._inner.close()
+
+        # a failed or interrupted run must not replace a good cassette
+        if not self._complete:
+            return
+
+        # write next to the cassette and swap it in, so it is never half-written
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=self.path.parent,
+            suffix=".tmp",
+            delete=False,
+        ) as file:
+            json.dump(self.interactions, file, indent=2, ensure_ascii=False)
+            file.write("\n")
+        Path(file.name).replace(self.path)
+
+
+def record_on_success(test: Callable) -> Callable:
+    """
+    Decorate a test that uses `self.transport`: the cassette it records is only
+    saved if the test body passes.
+    """
+
+    @functools.wraps(test)
+    def wrapper(self: object) -> None:
+        test(self)
+        self.transport.complete()
+
+    return wrapper
+
+
+class VirtualClock:
+    """Clock whose `sleep` advances a counter instead of blocking."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
@@ -1,63 +1,88 @@
+import json
+import subprocess
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 
 import httpx
 
 sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent))
 
-# now we can import the module in the parent directory.
-import anime_season_for_sonarr as script
+# now we can import the package in the parent directory and the test helpers.
+from cassette import (
+    CASSETTE_DIR,
+    CassetteMissError,
+    CassetteTransport,
+    VirtualClock,
+    record_on_success,
+)
+
+from anime_season_for_sonarr import anilist, cli, tmdb
+from anime_season_for_sonarr.config import Config
+from anime_season_for_sonarr.models import Show, ShowStore, Status
+
+TARGET_COUNTRIES = frozenset({"JP", "CN", "KR", "TW", "HK"})
 
 
 class TestScript(unittest.TestCase):
     def setUp(self):
-        script.TMDB_API_KEY = "ac395b50e4cb14bd5712fa08b936a447"
-        script.TARGET_COUNTRIES = {"JP", "CN", "KR", "TW", "HK"}
-        script.client = httpx.Client()
+        # each test replays its own cassette; record with CASSETTE_RECORD=1
+        cassette = CASSETTE_DIR / f"{self._testMethodName}.json"
+        self.transport = CassetteTransport(cassette)
+        self.client = httpx.Client(transport=self.transport)
+
+        self.anilist = anilist.AnilistRequestHandler(self.client, VirtualClock())
+        self.tmdb = tmdb.TMDBRequestHandler(
+            self.client, "ac395b50e4cb14bd5712fa08b936a447"
+        )
 
     def tearDown(self):
-        script.client.close()
+        self.client.close()
 
+    @record_on_success
     def test_get_season_list_no_filters(self):
-        shows = script.get_season_list(2021, "spring")
+        """Every page is requested and parsed into shows, in order."""
+
+        # the cassette has one show per page, see tests/cassettes/README.md
+        shows = anilist.get_season_list(self.anilist, 2021, "spring")
 
         expected_output = (
-            script.Show(
+            Show(
                 english_title="ZOMBIE LAND SAGA REVENGE",
                 romaji_title="Zombie Land Saga: Revenge",
                 anilist_id=110733,
                 air_year=2021,
                 tmdb_id=None,
                 tvdb_id=None,
-            ),  # first expected item in response
-            script.Show(
+            ),  # only item on page 1
+            Show(
                 english_title=None,
                 romaji_title="Oshiri Tantei 5",
                 anilist_id=132697,
                 air_year=2021,
                 tmdb_id=None,
                 tvdb_id=None,
-            ),  # last expected item in response
+            ),  # only item on page 2
         )
 
-        # just test the first and last items in response
-        self.assertTupleEqual((shows[0], shows[-1]), expected_output)
-        # and that the number of items is correct
-        self.assertEqual(len(shows), 47)
+        self.assertTupleEqual(tuple(shows), expected_output)
 
+    @record_on_success
     def test_get_TMDB_genre_id(self):
-        self.assertEqual(script.get_TMDB_genre_id("Animation"), 16)
+        self.assertEqual(tmdb.get_TMDB_genre_id(self.tmdb, "Animation"), 16)
 
+    @record_on_success
     def test_search_TMDB_for_show(self):
-        test_input = script.Show(
+        test_input = Show(
             english_title="BOCCHI THE ROCK!",
             romaji_title="Bocchi the Rock!",
             anilist_id=130003,
             air_year=2022,
         )
 
-        expected_output = script.Show(
+        expected_output = Show(
             english_title="BOCCHI THE ROCK!",
             romaji_title="Bocchi the Rock!",
             anilist_id=130003,
@@ -65,29 +90,219 @@ class TestScript(unittest.TestCase):
             tmdb_id=119100,
         )
 
-        test_input.tmdb_id = script.search_TMDB_for_show(test_input, 16)
+        test_input.tmdb_id = tmdb.search_TMDB_for_show(
+            self.tmdb, self.anilist, test_input, 16, TARGET_COUNTRIES
+        )
 
         self.assertEqual(test_input, expected_output)
 
+    @record_on_success
     def test_search_previous_season(self):
-        test_input = script.Show(
+        test_input = Show(
             english_title="Kaguya-sama: Love is War -Ultra Romantic-",
             romaji_title="Kaguya-sama wa Kokurasetai: Ultra Romantic",
             anilist_id=125367,
             air_year=2022,
         )
 
-        expected_output = script.Show(
+        expected_output = Show(
             english_title="Kaguya-sama: Love is War?",
             romaji_title="Kaguya-sama wa Kokurasetai?: Tensaitachi no Renai Zunousen",
             anilist_id=112641,
             air_year=2020,
         )
 
-        self.assertEqual(script.search_previous_season(test_input), expected_output)
+        self.assertEqual(
+            anilist.search_previous_season(self.anilist, test_input), expected_output
+        )
 
+    @record_on_success
     def test_get_TVDB_id_from_TMDB_id(self):
-        self.assertEqual(script.get_TVDB_id_from_TMDB_id(65844), 303867)
+        self.assertEqual(tmdb.get_TVDB_id_from_TMDB_id(self.tmdb, 65844), 303867)
+
+    @record_on_success
+    def test_filtering(self):
+        shows = anilist.get_season_list(
+            self.anilist,
+            2025,
+            "fall",
+            genres_include=["comedy", "slice of life"],
+            genres_exclude=["romance"],
+            tags_include=["work"],
+            tags_exclude=["Parody"],
+        )
+
+        expected_output = Show(
+            english_title="A Mangaka's Weirdly Wonderful Workplace",
+            romaji_title="Egao no Taenai Shokuba desu.",
+            anilist_id=173523,
+            air_year=2025,
+            tmdb_id=None,
+            tvdb_id=None,
+        )
+
+        self.assertEqual(shows[0], expected_output)
+
+
+class TestTMDBRequests(unittest.TestCase):
+    def setUp(self):
+        self.urls: list[str] = []
+        self.responses: list[dict] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.urls.append(str(request.url))
+            return httpx.Response(200, json=self.responses.pop(0))
+
+        self.client = httpx.Client(transport=httpx.MockTransport(handler))
+        self.tmdb = tmdb.TMDBRequestHandler(self.client, "key")
+
+    def tearDown(self):
+        self.client.close()
+
+    def test_get_builds_url(self):
+        self.responses = [{"total_results": 0}]
+
+        self.tmdb.get("search/tv", {"query": "Bocchi the Rock!", "page": 1})
+
+        self.assertEqual(
+            self.urls,
+            [
+                "https://api.themoviedb.org/3/search/tv"
+                "?api_key=key&query=Bocchi+the+Rock%21&page=1"
+            ],
+        )
+
+    def test_search_pagination_keeps_query(self):
+        page = {"page": 1, "total_pages": 2, "total_results": 2}
+        self.responses = [
+            {
+                **page,
+                "results": [{"id": 1, "genre_ids": [16], "origin_country": ["US"]}],
+            },
+            {
+                **page,
+                "page": 2,
+                "results": [{"id": 2, "genre_ids": [16], "origin_country": ["JP"]}],
+            },
+        ]
+        show = Show(
+            english_title=None,
+            romaji_title="Bocchi the Rock!",
+            anilist_id=130003,
+            air_year=2022,
+        )
+
+        tmdb_id = tmdb.search_TMDB_for_show(self.tmdb, None, show, 16, TARGET_COUNTRIES)
+
+        self.assertEqual(tmdb_id, 2)
+        self.assertEqual(
+            self.urls[1],
+            "https://api.themoviedb.org/3/search/tv"
+            "?api_key=key&first_air_date_year=2022&query=Bocchi+the+Rock%21&page=2",
+        )
+
+
+class TestConfig(unittest.TestCase):
+    def test_from_dict_example(self):
+        import tomllib  # noqa: PLC0415
+
+        with open(Path(__file__).parent.parent / "config.toml.example", "rb") as file:
+            config = Config.from_dict(tomllib.load(file))
+
+        self.assertFalse(config.select_all)
+        self.assertEqual(config.target_countries, TARGET_COUNTRIES)
+        self.assertEqual(config.genres_include, [])
+        self.assertEqual(config.tmdb_api_key, "ac395b50e4cb14bd5712fa08b936a447")
+        self.assertEqual(config.sonarr_base_url, "http://localhost:8989")
+        self.assertEqual(config.root_folder, "C:\\example\\path")
+        # "NULL" language profile and empty tags are passed to Sonarr as None
+        self.assertIsNone(config.language_profile)
+        self.assertIsNone(config.tags)
+        self.assertEqual(config.series_type, "anime")
+
+
+class TestCLI(unittest.TestCase):
+    def test_main_without_arguments(self):
+        from contextlib import redirect_stdout  # noqa: PLC0415
+        from io import StringIO  # noqa: PLC0415
+
+        with redirect_stdout(StringIO()), self.assertRaises(SystemExit) as cm:  # noqa: PT027
+            cli.main([])
+
+        self.assertEqual(cm.exception.code, 1)
+
+
+class TestCassetteTransport(unittest.TestCase):
+    URL = "https://api.themoviedb.org/3/tv/65844/external_ids"
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cassette = Path(self.tmp.name) / "cassette.json"
+
+        inner = httpx.MockTransport(
+            lambda _request: httpx.Response(200, json={"tvdb_id": 303867})
+        )
+        transport = CassetteTransport(self.cassette, record=True, inner=inner)
+        with httpx.Client(transport=transport) as client:
+            client.get(self.URL, params={"api_key": "secret"})
+            transport.complete()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_record_strips_api_key(self):
+        with open(self.cassette, encoding="utf-8") as file:
+            interactions = json.load(file)
+
+        self.assertEqual(len(interactions), 1)
+        self.assertEqual(interactions[0]["request"]["url"], self.URL)
+        self.assertNotIn("secret", self.cassette.read_text(encoding="utf-8"))
+
+    def test_replay_ignores_api_key(self):
+        with httpx.Client(
+            transport=CassetteTransport(self.cassette, record=False)
+        ) as client:
+            response = client.get(self.URL, params={"api_key": "another"})
+
+        self.assertEqual(response.json(), {"tvdb_id": 303867})
+
+    def test_replay_miss(self):
+        with httpx.Client(
+            transport=CassetteTransport(self.cassette, record=False)
+        ) as client:
+            client.get(self.URL)
+            # every recorded response is answered once
+            self.assertRaises(CassetteMissError, client.get, self.URL)  # noqa: PT027
+
+    def test_incomplete_recording_keeps_cassette(self):
+        recorded = self.cassette.read_text(encoding="utf-8")
+        inner = httpx.MockTransport(lambda _request: httpx.Response(500))
+
+        # recording never marked complete, e.g. the test failed halfway
+        with httpx.Client(
+            transport=CassetteTransport(self.cassette, record=True, inner=inner)
+        ) as client:
+            client.get(self.URL)
+
+        self.assertEqual(self.cassette.read_text(encoding="utf-8"), recorded)
+        self.assertEqual(list(self.cassette.parent.iterdir()), [self.cassette])
+
+    def test_missing_cassette(self):
+        self.assertRaises(  # noqa: PT027
+            CassetteMissError,
+            CassetteTransport,
+            Path(self.tmp.name) / "missing.json",
+            record=False,
+        )
+
+
+class TestAnilistRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.clock = VirtualClock()
+        self.anilist = anilist.AnilistRequestHandler(httpx.Client(), self.clock)
+
+    def tearDown(self):
+        self.anilist.client.close()
 
     def test_anilist_rate_limiter(self):
         """Test the ratelimiting functionality."""
@@ -101,35 +316,117 @@ class TestScript(unittest.TestCase):
             "X-RateLimit-Remaining": "0",
         }
 
-        import time  # noqa: PLC0415
+        retry = self.anilist._handle_outcome(mock_response_429)
 
-        start_time = time.time()
-        script.AnilistRequestHandler._handle_outcome(mock_response_429)
-        elapsed_time = time.time() - start_time
+        # Should have waited exactly Retry-After seconds and asked for a retry
+        self.assertTrue(retry)
+        self.assertEqual(self.clock.now, 1.0)
 
-        # Should have waited at least 1 second
-        self.assertGreaterEqual(elapsed_time, 1.0)
+    def test_anilist_rate_limiter_fallback(self):
+        """Without Retry-After the handler falls back to a 60 second wait."""
 
-    def test_filtering(self):
-        shows = script.get_season_list(
-            2025,
-            "fall",
-            genres_include=["comedy", "slice of life"],
-            genres_exclude=["romance"],
-            tags_include=["work"],
-            tags_exclude=["Parody"],
+        from unittest.mock import Mock  # noqa: PLC0415
+
+        mock_response_429 = Mock(spec=httpx.Response)
+        mock_response_429.status_code = 429
+        mock_response_429.headers = {}
+
+        self.anilist._handle_outcome(mock_response_429)
+
+        self.assertEqual(self.clock.now, 60.0)
+
+
+class TestShowStore(unittest.TestCase):
+    def setUp(self):
+        self.shows = [
+            Show(
+                english_title="BOCCHI THE ROCK!",
+                romaji_title="Bocchi the Rock!",
+                anilist_id=130003,
+                air_year=2022,
+            ),
+            Show(
+                english_title=None,
+                romaji_title="Oshiri Tantei 5",
+                anilist_id=132697,
+                air_year=2021,
+                tmdb_id=1,
+                tvdb_id=2,
+            ),
+        ]
+        self.store = ShowStore(self.shows)
+
+    def test_round_trip(self):
+        self.assertEqual(len(self.store), 2)
+        self.assertEqual(list(self.store), self.shows)
+        self.assertEqual(self.store[-1], self.shows[-1])
+
+    def test_index_out_of_range(self):
+        for row in (2, -3):
+            with self.subTest(row=row):
+                self.assertRaises(IndexError, self.store.__getitem__, row)  # noqa: PT027
+
+    def test_bad_append_leaves_store_unchanged(self):
+        for show in (
+            Show("a", "b", 5, 2020, tmdb_id=2**31),  # doesn't fit in the ID column
+            Show("a", "b", 5, 70_000),  # doesn't fit in the year column
+            Show("a", "b", "5", 2020),  # not an int
+        ):
+            with self.subTest(show=show):
+                self.assertRaises(  # noqa: PT027
+                    (OverflowError, TypeError), self.store.append, show
+                )
+
+                self.assertEqual(len(self.store), 2)
+                self.assertEqual(list(self.store), self.shows)
+                self.assertNotIn(5, self.store._rows)
+
+    def test_row_lookup(self):
+        self.assertEqual(self.store.row(130003), 0)
+        self.assertEqual(self.store.row(132697), 1)
+
+    def test_update_and_status(self):
+        self.store.update(0, tmdb_id=119100, tvdb_id=421069, status=Status.FOUND)
+        self.store.update(1, status=Status.ERROR)
+
+        self.assertEqual(self.store[0].tmdb_id, 119100)
+        self.assertEqual(self.store.status(0), Status.FOUND)
+        self.assertEqual(self.store.count(Status.FOUND), 1)
+        self.assertEqual(self.store.tvdb_ids(Status.FOUND), [421069])
+        self.assertEqual(self.store.shows(Status.ERROR), [self.shows[1]])
+
+    def test_equal_titles_are_shared(self):
+        title = "Oshiri Tantei"
+        row = self.store.append(
+            Show(
+                english_title="".join(title),  # equal but a distinct object
+                romaji_title=title,
+                anilist_id=1,
+                air_year=2020,
+            )
         )
 
-        expected_output = script.Show(
-            english_title="A Mangaka's Weirdly Wonderful Workplace",
-            romaji_title="Egao no Taenai Shokuba desu.",
-            anilist_id=173523,
-            air_year=2025,
-            tmdb_id=None,
-            tvdb_id=None,
+        self.assertIs(self.store[row].english_title, self.store[row].romaji_title)
+
+
+class TestStartup(unittest.TestCase):
+    def test_cli_imports_no_heavy_dependencies(self):
+        """The CLI module must leave httpx, arrapi, questionary and tabulate unloaded."""
+
+        code = (
+            "import sys, anime_season_for_sonarr.cli\n"
+            "print(' '.join(m for m in ('httpx', 'arrapi', 'questionary', 'tabulate')"
+            " if m in sys.modules))"
+        )
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).parent.parent,
+            capture_output=True,
+            text=True,
+            check=True,
         )
 
-        self.assertEqual(shows[0], expected_output)
+        self.assertEqual(result.stdout.strip(), "")
 
 
 if __name__ == "__main__":